@@ -22,6 +22,8 @@ import baseCommand from './scripts/base.py'
 import execCommand from './scripts/exec.py'
 // Command that lists all symbols (e.g. locals, globals) in the current context.
 import contextCommand from './scripts/context.py'
+// Shared cache of the source file list.
+import sourcesCache from './scripts/sources_cache.py'
 // Command that searches source files using regex.
 import sourcesCommand from './scripts/sources.py'
 // Command that returns the current thread group.
@@ -374,7 +376,7 @@ class GDB extends EventEmitter {
   init () {
     return this._sync(async () => {
       let scripts = [baseCommand, baseEvent, execCommand, contextCommand,
-        sourcesCommand, groupCommand, threadCommand, objfileEvent]
+        sourcesCache, sourcesCommand, groupCommand, threadCommand, objfileEvent]
 
       for (let s of scripts) {
         await this._execMI(`-interpreter-exec console "python\\n${escape(s)}"`)
@@ -739,8 +741,17 @@ class GDB extends EventEmitter {
    */
   context (thread) {
     return this._sync(async () => {
-      let res = await this._execCMD('context', thread)
-      return res.map((v) => new Variable(v))
+      let { cols, rows, rle } = await this._execCMD('context', thread)
+      // The `type` and `scope` columns arrive run-length encoded.
+      let expand = (runs) => runs.reduce((values, run) =>
+        values.concat(new Array(run[1]).fill(run[0])), [])
+      let types = expand(rle.type)
+      let scopes = expand(rle.scope)
+      return rows.map((row, index) => {
+        let options = { type: types[index], scope: scopes[index] }
+        cols.forEach((col, colIndex) => { options[col] = row[colIndex] })
+        return new Variable(options)
+      })
     })
   }
 
@@ -2,6 +2,29 @@ import gdb
 import sys
 import json
 
+# `orjson` is a native encoder that is several times faster than the
+# stdlib, but it's optional — GDB's Python environment may not have it.
+try:
+    import orjson
+
+    # `default` takes care of the tuple rows which orjson
+    # doesn't serialize natively.
+    def _encode(res):
+        return (orjson.dumps(res, default=list).decode("utf-8"),)
+
+    def _encode_bytes(res):
+        return (orjson.dumps(res, default=list),)
+except ImportError:
+    # Compact separators keep the payload small and the encoder is
+    # reused across invocations. `iterencode` streams chunks to stdout
+    # instead of building the whole JSON string in memory first.
+    _encode = json.JSONEncoder(ensure_ascii=False,
+                               separators=(",", ":")).iterencode
+
+    def _encode_bytes(res):
+        for chunk in _encode(res):
+            yield chunk.encode("utf-8")
+
 
 class BaseCommand(gdb.Command):
     """Base class for custom GDB commands."""
@@ -9,9 +32,27 @@ class BaseCommand(gdb.Command):
     def __init__(self, name):
         super(BaseCommand, self).__init__("gdbjs-" + name, gdb.COMMAND_USER)
         self.name = name
+        # The name never changes, so format the wrapper once.
+        self._prefix = '<gdbjs:cmd:%s ' % name
+        self._suffix = ' %s:cmd:gdbjs>' % name
+        self._prefix_bytes = self._prefix.encode('ascii')
+        self._suffix_bytes = self._suffix.encode('ascii')
 
     def invoke(self, arg, from_tty):
-        res = json.dumps(self.action(arg, from_tty), ensure_ascii=False)
-        msg = '<gdbjs:cmd:{0} {1} {0}:cmd:gdbjs>'.format(self.name, res)
-        sys.stdout.write(msg)
+        res = self.action(arg, from_tty)
+        # GDB replaces sys.stdout with its own stream object which has
+        # no underlying binary buffer, hence the text fallback.
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is not None:
+            write = buffer.write
+            write(self._prefix_bytes)
+            for chunk in _encode_bytes(res):
+                write(chunk)
+            write(self._suffix_bytes)
+        else:
+            write = sys.stdout.write
+            write(self._prefix)
+            for chunk in _encode(res):
+                write(chunk)
+            write(self._suffix)
         sys.stdout.flush()
@@ -1,5 +1,17 @@
 import gdb
 from builtins import str
+from itertools import groupby
+
+# Scope lookup table indexed by
+# `(is_global << 2) | (is_static << 1) | is_argument`.
+_SCOPES = ["local", "argument", "static", "static",
+           "global", "global", "global", "global"]
+
+
+def _rle(values):
+    """Run-length encode values as [value, run] pairs."""
+
+    return [[value, len(list(group))] for value, group in groupby(values)]
 
 
 class ContextCommand(BaseCommand):
@@ -12,25 +24,30 @@ class ContextCommand(BaseCommand):
         frame = gdb.selected_frame()
         block = frame.block()
         names = set()
-        variables = []
+        rows = []
+        types = []
+        scopes = []
         while block:
+            # The block part of the scope key is the same for the
+            # whole block, so compute it once per block.
+            block_key = (block.is_global << 2) | (block.is_static << 1)
             for symbol in block:
+                if not (symbol.is_argument or symbol.is_variable or
+                        symbol.is_function or symbol.is_constant):
+                    continue
                 name = symbol.name
-                if (name not in names) and (symbol.is_argument or
-                   symbol.is_variable or symbol.is_function or
-                   symbol.is_constant):
-                    scope = "global" if block.is_global else \
-                            "static" if block.is_static else \
-                            "argument" if symbol.is_argument else \
-                            "local"
-                    names.add(name)
-                    variables.append({
-                        "name": symbol.name,
-                        "value": str(symbol.value(frame)),
-                        "type": str(symbol.type),
-                        "scope": scope
-                    })
+                if name in names:
+                    continue
+                names.add(name)
+                rows.append((name, str(symbol.value(frame))))
+                types.append(str(symbol.type))
+                scopes.append(_SCOPES[block_key | symbol.is_argument])
             block = block.superblock
-        return variables
+        # Tabular layout: column names are sent once instead of being
+        # repeated as object keys on every row. Types and scopes tend
+        # to repeat across neighbouring symbols, so they are
+        # run-length encoded instead of being sent per row.
+        return {"cols": ["name", "value"], "rows": rows,
+                "rle": {"type": _rle(types), "scope": _rle(scopes)}}
 
 gdbjsContext = ContextCommand()
@@ -4,5 +4,5 @@ import sys
 def base_event_handler(name, msg):
     """Base handler for custom events."""
 
-    sys.stdout.write('<gdbjs:event:{0} {1} {0}:event:gdbjs>'.format(name, msg))
+    sys.stdout.write('<gdbjs:event:%s %s %s:event:gdbjs>' % (name, msg, name))
     sys.stdout.flush()
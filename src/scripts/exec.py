@@ -1,6 +1,25 @@
 import gdb
 import sys
-import re
+
+_EVENT_START = '<gdbjs:event:'
+_EVENT_END = ':event:gdbjs>'
+
+
+def _extract_events(res):
+    """Extract event messages embedded in CLI output."""
+
+    events = []
+    pos = 0
+    while True:
+        start = res.find(_EVENT_START, pos)
+        if start < 0:
+            return events
+        end = res.find(_EVENT_END, start)
+        if end < 0:
+            return events
+        end += len(_EVENT_END)
+        events.append(res[start:end])
+        pos = end
 
 
 class ExecCommand(BaseCommand):
@@ -12,8 +31,8 @@ class ExecCommand(BaseCommand):
     def action(self, arg, from_tty):
         res = gdb.execute(arg, False, True)
         # Results of CLI execution might accidently contain events.
-        events = re.findall("<gdbjs:event:.*?:event:gdbjs>", res)
-        for e in events: sys.stdout.write(e)
+        if _EVENT_START in res:
+            sys.stdout.write("".join(_extract_events(res)))
         return res
 
 gdbjsExec = ExecCommand()
@@ -1,6 +1,10 @@
 import gdb
 import re
 
+# Source paths are ASCII in practice, and ASCII semantics skip the
+# Unicode tables for character classes. `re.ASCII` is Python 3 only.
+_ASCII = getattr(re, 'ASCII', 0)
+
 
 class SourcesCommand(BaseCommand):
     """Search for source files using regex."""
@@ -9,10 +13,7 @@ class SourcesCommand(BaseCommand):
         super(SourcesCommand, self).__init__("sources")
 
     def action(self, arg, from_tty):
-        info = gdb.execute("info sources", False, True)
-        # XXX: not sure, whether there is a better way.
-        info = re.sub("Reading symbols .*?\.{3}done\.", "", info)
-        files = re.findall(r"([/\\].*?)[,\n]", info)
-        return [f for f in files if re.search(arg, f)]
+        pattern = re.compile(arg, _ASCII)
+        return [f for f in get_sources() if pattern.search(f)]
 
 gdbjsSources = SourcesCommand()
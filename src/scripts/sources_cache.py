@@ -0,0 +1,30 @@
+import gdb
+import re
+
+# XXX: not sure, whether there is a better way.
+_READING = re.compile(r"Reading symbols .*?\.{3}done\.")
+# A negated class scans linearly, unlike the lazy `.*?` which made the
+# engine backtrack on every character.
+_FILES = re.compile(r"[/\\][^,\n]*")
+
+# Parsed `info sources` output, shared by every command that needs the
+# source file list. It's reset from `new_objfile_handler` since
+# loading an objfile may bring new source files.
+_sources_cache = None
+
+
+def get_sources():
+    """Return the list of source files, running `info sources` once."""
+
+    global _sources_cache
+    if _sources_cache is None:
+        info = _READING.sub("", gdb.execute("info sources", False, True))
+        _sources_cache = _FILES.findall(info)
+    return _sources_cache
+
+
+def invalidate_sources():
+    """Drop the cached source file list."""
+
+    global _sources_cache
+    _sources_cache = None
@@ -11,7 +11,8 @@ class ThreadCommand(BaseCommand):
         thread = gdb.selected_thread()
         # `global_num` was introduced in GDB 7.11
         num = getattr(thread, 'global_num', None) or thread.num if thread else None
-        inferior = gdbjsThreadGroup.action(arg, from_tty)
-        return { "id": num or None, "group": inferior }
+        inferior = gdb.selected_inferior()
+        return { "id": num or None,
+                 "group": { "id": inferior.num, "pid": inferior.pid } }
 
 gdbjsThread = ThreadCommand()